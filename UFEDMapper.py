@@ -7,21 +7,60 @@ Processes a KML file to generate an interactive map using Plotly.
 """
 
 import os
+import mmap
+import stat
+import re
 import sys
+import html
 import time
 import logging
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import argparse
+import hashlib
+import multiprocessing
+from io import BytesIO
+from array import array
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import pandas as pd
 from lxml import etree
 from tqdm import tqdm
-import pytz
 import numpy as np
 
 # Global Constants
 LOG_FILE = 'UFEDMapper.log'
 DEFAULT_KML_FILE = 'Locations.kml'
+SCRIPT_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, 'frozen', False) else __file__))
+CACHE_DIR = os.path.join(SCRIPT_DIR, 'cache')
+# Bump whenever parse_kml changes its output so stale cache files are not reused
+CACHE_VERSION = 2
+HEATMAP_BINNING_THRESHOLD = 100_000
+HEATMAP_BINS = 512
+UTC = timezone.utc
+
+# Namespace-qualified KML tags, precomputed to avoid rebuilding them per placemark
+KML_NS = 'http://www.opengis.net/kml/2.2'
+TAG_PLACEMARK = f'{{{KML_NS}}}Placemark'
+TAG_NAME = f'{{{KML_NS}}}name'
+TAG_COORDS = f'{{{KML_NS}}}coordinates'
+TAG_TIME = f'{{{KML_NS}}}TimeStamp'
+TAG_WHEN = f'{{{KML_NS}}}when'
+TAG_DESC = f'{{{KML_NS}}}description'
+TAG_DATA = f'{{{KML_NS}}}Data'
+TAG_VALUE = f'{{{KML_NS}}}value'
+
+# Arrow-backed string dtype that marks missing values as NaN instead of pd.NA,
+# which Plotly's JSON encoders (notably orjson) cannot serialize
+try:
+    STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except TypeError:
+    STRING_DTYPE = "string[pyarrow_numpy]"
+
+# Matches HTML tags in placemark descriptions
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Plotly Express is only loaded once the first plot is created
+_px = None
 
 # Configure logging
 def configure_logging():
@@ -70,6 +109,19 @@ def print_header():
     print("===============================")
     print_blank_line()
 
+def _get_px():
+    """
+    Import Plotly Express on first use and cache the module.
+
+    Returns:
+        module: The plotly.express module.
+    """
+    global _px
+    if _px is None:
+        import plotly.express as px
+        _px = px
+    return _px
+
 def clean_html(html_text):
     """
     Remove HTML tags from a string.
@@ -82,9 +134,7 @@ def clean_html(html_text):
     """
     if html_text is None:
         return None
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html_text, "html.parser")
-    return soup.get_text()
+    return html.unescape(_TAG_RE.sub('', html_text)).strip()
 
 # User interaction functions
 def get_kml_filename():
@@ -94,8 +144,7 @@ def get_kml_filename():
     Returns:
         str: The selected KML file name.
     """
-    script_dir = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, 'frozen', False) else __file__))
-    kml_files = sorted([f for f in os.listdir(script_dir) if f.endswith('.kml')], key=lambda x: x.lower())
+    kml_files = sorted((entry.name for entry in os.scandir(SCRIPT_DIR) if entry.is_file() and entry.name.lower().endswith('.kml')), key=str.lower)
 
     if (kml_files):
         print("Available KML files:")
@@ -129,7 +178,7 @@ def get_kml_filename():
         print_blank_line()
         if not kml_file:
             kml_file = DEFAULT_KML_FILE
-        elif not kml_file.endswith('.kml'):
+        elif not kml_file.lower().endswith('.kml'):
             kml_file += '.kml'
 
     logging.info(f"KML file chosen: {kml_file}")
@@ -176,8 +225,15 @@ def choose_plot_types():
         print(f"{key}. {value}")
     
     print_blank_line()
-    choices = input("Enter the numbers of the plot types: ")
-    chosen_plot_types = [plot_types.get(choice.strip(), "Scatter Plot") for choice in choices.split(',')]
+    while True:
+        choices = input("Enter the numbers of the plot types: ").strip()
+        if not choices:
+            chosen_plot_types = ["Scatter Plot"]
+            break
+        chosen_plot_types = [plot_types.get(choice.strip()) for choice in choices.split(',')]
+        if all(chosen_plot_types):
+            break
+        print("Invalid input. Please enter valid numbers separated by commas.")
     logging.info(f"Plot types chosen: {chosen_plot_types}")
     return chosen_plot_types
 
@@ -202,7 +258,7 @@ def get_date_range(df):
             if not date_str:
                 return None
             try:
-                date = datetime.strptime(date_str, "%d.%m.%Y").replace(tzinfo=pytz.UTC)
+                date = datetime.strptime(date_str, "%d.%m.%Y").replace(tzinfo=UTC)
                 if date < df['timestamp'].min() or date > df['timestamp'].max():
                     print(f"Error: Date must be between {min_date} and {max_date}.")
                 else:
@@ -234,24 +290,48 @@ def validate_kml_file(kml_file):
         kml_file (str): The KML file name.
 
     Returns:
-        str: The validated KML file name.
+        os.stat_result: The file status of the validated KML file.
     
     Raises:
         FileNotFoundError: If the file does not exist.
         ValueError: If the file is not a KML file.
     """
-    if not os.path.isfile(kml_file):
-        logging.error(f"Error: The file '{kml_file}' could not be found.")
-        raise FileNotFoundError(f"Error: The file '{kml_file}' could not be found.")
-    if not kml_file.endswith('.kml'):
+    if not kml_file.lower().endswith('.kml'):
         logging.error(f"Error: The file '{kml_file}' is not a KML file.")
         raise ValueError(f"Error: The file '{kml_file}' is not a KML file.")
+    try:
+        file_stat = os.stat(kml_file)
+    except OSError:
+        file_stat = None
+    if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+        logging.error(f"Error: The file '{kml_file}' could not be found.")
+        raise FileNotFoundError(f"Error: The file '{kml_file}' could not be found.")
     logging.info(f"Validated KML file: {kml_file}")
-    return kml_file
+    return file_stat
+
+def convert_text_columns(df):
+    """
+    Store repetitive text columns (names, ExtendedData values) as categories and the remaining
+    text as Arrow-backed strings instead of Python objects to save memory.
+
+    Parquet restores these columns with pd.NA as missing value, so this is applied again after reading.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        pd.DataFrame: The DataFrame with converted text columns.
+    """
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if df[col].nunique() / max(len(df), 1) < 0.5:
+            df[col] = df[col].astype('category')
+        else:
+            df[col] = df[col].astype(STRING_DTYPE)
+    return df
 
 def parse_kml(file_path):
     """
-    Parse the KML file and extract relevant data using parallel processing.
+    Parse the KML file and extract relevant data using streaming processing.
 
     Args:
         file_path (str): Path to the KML file.
@@ -262,108 +342,189 @@ def parse_kml(file_path):
     Raises:
         ValueError: If there is an error parsing the KML file.
     """
+    # Fixed fields are collected column-wise; ExtendedData keys vary per placemark
+    names = []
+    lons = array('d')
+    lats = array('d')
+    timestamps_raw = []
+    descriptions = []
+    extended = []
+
     def process_placemark(elem):
         try:
-            placemark_data = {}
-            placemark_data['name'] = elem.find('.//{http://www.opengis.net/kml/2.2}name').text
-            coordinates = elem.find('.//{http://www.opengis.net/kml/2.2}coordinates').text.strip()
-            coord_parts = coordinates.split(',')
-            placemark_data['longitude'], placemark_data['latitude'] = map(float, coord_parts[:2])
-
-            timestamp_elem = elem.find('.//{http://www.opengis.net/kml/2.2}TimeStamp')
-            if timestamp_elem is not None:
-                when = timestamp_elem.find('{http://www.opengis.net/kml/2.2}when').text
-                try:
-                    placemark_data['timestamp'] = datetime.fromisoformat(when.replace("Z", "+00:00")).astimezone(pytz.UTC)
-                except ValueError:
-                    placemark_data['timestamp'] = None
-            else:
-                placemark_data['timestamp'] = None
-
-            description_elem = elem.find('.//{http://www.opengis.net/kml/2.2}description')
-            placemark_data['description'] = clean_html(description_elem.text) if description_elem is not None else None
-
-            extended_data = elem.findall('.//{http://www.opengis.net/kml/2.2}Data')
-            for data_elem in extended_data:
-                key = data_elem.get('name')
-                value = data_elem.find('{http://www.opengis.net/kml/2.2}value').text
-                placemark_data[key] = value
-
-            return placemark_data
-        except (etree.XMLSyntaxError, AttributeError) as e:
+            name = elem.find(TAG_NAME).text
+            # Coordinates are nested inside the geometry element (e.g. Point)
+            coordinates = next(elem.iter(TAG_COORDS), None).text.strip()
+            # Only longitude and latitude are needed, so avoid splitting the altitude off as well
+            lon_str, _, rest = coordinates.partition(',')
+            lat_str, _, _ = rest.partition(',')
+            longitude = float(lon_str)
+            latitude = float(lat_str)
+
+            # Timestamps are kept raw here and converted in one vectorized pass later
+            timestamp_elem = elem.find(TAG_TIME)
+            when = timestamp_elem.find(TAG_WHEN).text if timestamp_elem is not None else None
+
+            description_elem = elem.find(TAG_DESC)
+            description = clean_html(description_elem.text) if description_elem is not None else None
+
+            extended_data = {data_elem.get('name'): data_elem.find(TAG_VALUE).text for data_elem in elem.iter(TAG_DATA)}
+        except (etree.XMLSyntaxError, AttributeError, ValueError) as e:
             logging.error(f"Error parsing placemark: {e}")
-            return None
+            return
+
+        names.append(name)
+        lons.append(longitude)
+        lats.append(latitude)
+        timestamps_raw.append(when)
+        descriptions.append(description)
+        extended.append(extended_data)
 
     try:
-        context = etree.iterparse(file_path, events=('end',), tag='{http://www.opengis.net/kml/2.2}Placemark')
-        placemarks = []
-
-        with ThreadPoolExecutor() as executor:
-            futures = {executor.submit(process_placemark, elem): elem for event, elem in context}
-            for future in tqdm(as_completed(futures), total=len(futures), desc="Parsing KML file", unit=" placemarks"):
-                placemark_data = future.result()
-                if placemark_data:
-                    placemarks.append(placemark_data)
-                futures[future].clear()
-
-        df = pd.DataFrame(placemarks)
+        # Read the file through a read-only memory map so the OS page cache serves the parser directly
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            context = etree.iterparse(mm, events=('end',), tag=TAG_PLACEMARK)
+
+            # Process each placemark as soon as it is complete and discard it afterwards,
+            # so memory usage stays constant regardless of the file size.
+            for event, elem in tqdm(context, desc="Parsing KML file", unit=" placemarks"):
+                process_placemark(elem)
+                elem.clear(keep_tail=True)
+                parent = elem.getparent()
+                while parent is not None and elem.getprevious() is not None:
+                    del parent[0]
+
+        df = pd.DataFrame({
+            'name': names,
+            'longitude': np.frombuffer(lons, dtype=np.float64),
+            'latitude': np.frombuffer(lats, dtype=np.float64),
+            'timestamp': pd.to_datetime(pd.Series(timestamps_raw, dtype=object), utc=True, format='ISO8601', errors='coerce'),
+            'description': descriptions,
+        })
+        if any(extended):
+            df = df.join(pd.DataFrame(extended), rsuffix='_data')
+        df = convert_text_columns(df)
+
         valid_timestamp_count = df['timestamp'].notna().sum()
         invalid_timestamp_count = df['timestamp'].isna().sum()
 
-        logging.info(f"KML file parsed successfully with {len(placemarks)} placemarks, {valid_timestamp_count} valid timestamps, {invalid_timestamp_count} invalid timestamps")
+        logging.info(f"KML file parsed successfully with {len(df)} placemarks, {valid_timestamp_count} valid timestamps, {invalid_timestamp_count} invalid timestamps")
         return df, valid_timestamp_count, invalid_timestamp_count
 
-    except (etree.XMLSyntaxError, AttributeError) as e:
+    except (etree.XMLSyntaxError, AttributeError, ValueError) as e:
         logging.error(f"Error parsing KML file: {e}")
         raise ValueError(f"Error parsing KML file: {e}")
 
-def save_dataframe(df, output_file):
+def load_kml_data(kml_file, file_stat):
+    """
+    Load the parsed KML data from the cache, or parse the KML file and cache the result.
+
+    The cache key is derived from the file name, a hash of its absolute path, its size, modification
+    time and CACHE_VERSION, so a changed KML file or parser output is parsed again. Unreadable cache
+    files are replaced.
+
+    Args:
+        kml_file (str): The KML file name.
+        file_stat (os.stat_result): The file status returned by validate_kml_file.
+
+    Returns:
+        tuple: DataFrame containing the parsed data, count of valid timestamps, count of invalid timestamps.
+    """
+    base_name = os.path.splitext(os.path.basename(kml_file))[0]
+    path_hash = hashlib.sha1(os.path.normcase(os.path.abspath(kml_file)).encode('utf-8')).hexdigest()[:12]
+    cache_prefix = f"{base_name}_{path_hash}_"
+    cache_key = f"{cache_prefix}{file_stat.st_size}_{file_stat.st_mtime:.0f}_v{CACHE_VERSION}"
+    cache_file = os.path.join(CACHE_DIR, f"{cache_key}.parquet")
+
+    if os.path.isfile(cache_file):
+        try:
+            df = convert_text_columns(pd.read_parquet(cache_file))
+            valid_timestamp_count = df['timestamp'].notna().sum()
+            invalid_timestamp_count = df['timestamp'].isna().sum()
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+        else:
+            logging.info(f"Loaded cached data for {kml_file} from {cache_file}")
+            print(f"Loaded cached data from {cache_file}")
+            return df, valid_timestamp_count, invalid_timestamp_count
+
+    df, valid_timestamp_count, invalid_timestamp_count = parse_kml(kml_file)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        prune_cache(cache_prefix)
+        df.to_parquet(cache_file, index=False)
+        logging.info(f"Parsed data cached as {cache_file}")
+    except OSError as e:
+        logging.warning(f"Failed to cache parsed data: {e}")
+    return df, valid_timestamp_count, invalid_timestamp_count
+
+def prune_cache(cache_prefix):
+    """
+    Remove cache files written by another CACHE_VERSION and outdated cache files of the same KML file.
+
+    Args:
+        cache_prefix (str): The cache key prefix identifying the KML file by name and path.
+    """
+    version_suffix = f"_v{CACHE_VERSION}.parquet"
+    for entry in os.scandir(CACHE_DIR):
+        if not entry.is_file() or not entry.name.endswith('.parquet'):
+            continue
+        if entry.name.endswith(version_suffix) and not entry.name.startswith(cache_prefix):
+            continue
+        try:
+            os.remove(entry.path)
+            logging.info(f"Removed stale cache file {entry.path}")
+        except OSError as e:
+            logging.warning(f"Failed to remove stale cache file {entry.path}: {e}")
+
+def save_dataframe(df, output_file, write_csv=False):
     """
-    Save the DataFrame to a feather file and export a CSV for user reference.
+    Save the DataFrame to a Parquet file and optionally export a CSV for user reference.
 
     Args:
         df (pd.DataFrame): The DataFrame to save.
         output_file (str): The output file name.
-    """
-    feather_file = output_file.replace('.csv', '.feather')
-    df.reset_index(drop=True).to_feather(feather_file)
-    df.to_csv(output_file, index=False)
-    logging.info(f"Data saved as {feather_file} and {output_file}")
-    print(f"Data saved as {feather_file} and {output_file}")
+        write_csv (bool): Whether to export a CSV file as well.
+    """
+    parquet_file = output_file.replace('.csv', '.parquet')
+    df.to_parquet(parquet_file, compression='snappy', index=False)
+    if write_csv:
+        df.to_csv(output_file, index=False)
+        logging.info(f"Data saved as {parquet_file} and {output_file}")
+        print(f"Data saved as {parquet_file} and {output_file}")
+    else:
+        logging.info(f"Data saved as {parquet_file}")
+        print(f"Data saved as {parquet_file}")
 
-def save_dataframe_with_timestamps(df, output_file):
+def save_dataframe_with_timestamps(df, output_file, write_csv=False):
     """
-    Save the DataFrame with valid timestamps to separate feather and CSV files.
+    Save the DataFrame with valid timestamps to a separate Parquet file and optionally a CSV file.
 
     Args:
         df (pd.DataFrame): The DataFrame to save.
         output_file (str): The output file name.
+        write_csv (bool): Whether to export a CSV file as well.
 
     Returns:
-        tuple: The feather and CSV file names with timestamps.
+        pd.DataFrame: The DataFrame containing only rows with valid timestamps.
     """
-    timestamped_df = df.dropna(subset=['timestamp']).reset_index(drop=True)
-    timestamped_output_file = output_file.replace('.csv', '_timestamps.feather')
-    timestamped_csv_file = output_file.replace('.csv', '_timestamps.csv')
-    timestamped_df.to_feather(timestamped_output_file)
-    timestamped_df.to_csv(timestamped_csv_file, index=False)
-    logging.info(f"Data with timestamps saved as {timestamped_output_file} and {timestamped_csv_file}")
-    print(f"Data with timestamps saved as {timestamped_output_file} and {timestamped_csv_file}")
-    return timestamped_output_file, timestamped_csv_file
+    timestamped_df = df.dropna(subset=['timestamp'])
+    save_dataframe(timestamped_df, output_file.replace('.csv', '_timestamps.csv'), write_csv)
+    return timestamped_df
 
-def get_output_filename(kml_file, prefix):
+def get_output_filename(kml_file, prefix, timestamp):
     """
     Generate the output filename based on the KML filename.
 
     Args:
         kml_file (str): The KML file name.
         prefix (str): The prefix for the output file.
+        timestamp (str): The run timestamp to include in the file name.
 
     Returns:
         str: The generated output file name.
     """
     base_name = os.path.splitext(os.path.basename(kml_file))[0]
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     output_file = f"{prefix}_{timestamp}_{base_name}.csv"
     logging.info(f"Output CSV filename: {output_file}")
     return output_file
@@ -395,24 +556,39 @@ def analyze_data(df):
         dict: Analysis results including total points, duplicate points, unique points, and top visited locations.
     """
     total_points = len(df)
-    duplicate_points = df.duplicated(subset=['longitude', 'latitude']).sum()
-    unique_points = total_points - duplicate_points
 
-    # Count occurrences of each location using numpy
-    location_counts = df.groupby(['longitude', 'latitude']).size().reset_index(name='counts').to_numpy()
-    
-    # Top 10 most visited locations
-    top_10_most_visited = location_counts[np.argsort(location_counts[:, 2])][-10:]
-    
-    # Top 10 least visited locations
-    top_10_least_visited = location_counts[np.argsort(location_counts[:, 2])][:10]
+    # Count occurrences of each location by hashing the coordinates into integer codes.
+    # The combined lon/lat code is factorized again so bincount only needs one bin per location.
+    lon_codes, lon_values = pd.factorize(df['longitude'])
+    lat_codes, lat_values = pd.factorize(df['latitude'])
+    location_codes, location_keys = pd.factorize(lon_codes.astype(np.int64) * len(lat_values) + lat_codes)
+    counts = np.bincount(location_codes, minlength=len(location_keys))
+    unique_points = len(counts)
+    duplicate_points = total_points - unique_points
+
+    def ranked_locations(indices):
+        indices = indices[np.argsort(counts[indices], kind='stable')]
+        keys = location_keys[indices]
+        return pd.DataFrame({
+            'longitude': np.asarray(lon_values)[keys // max(len(lat_values), 1)],
+            'latitude': np.asarray(lat_values)[keys % max(len(lat_values), 1)],
+            'counts': counts[indices]
+        })
+
+    # Partial selection is enough for the top 10, no need to sort all locations
+    k = min(10, unique_points)
+    if k:
+        top_indices = np.argpartition(counts, -k)[-k:]
+        least_indices = np.argpartition(counts, k - 1)[:k]
+    else:
+        top_indices = least_indices = np.empty(0, dtype=np.intp)
 
     return {
         'total_points': total_points,
         'duplicate_points': duplicate_points,
         'unique_points': unique_points,
-        'top_10_most_visited': pd.DataFrame(top_10_most_visited, columns=['longitude', 'latitude', 'counts']),
-        'top_10_least_visited': pd.DataFrame(top_10_least_visited, columns=['longitude', 'latitude', 'counts'])
+        'top_10_most_visited': ranked_locations(top_indices),
+        'top_10_least_visited': ranked_locations(least_indices)
     }
 
 def save_analysis(analysis, output_file, valid_timestamp_count, invalid_timestamp_count):
@@ -427,7 +603,9 @@ def save_analysis(analysis, output_file, valid_timestamp_count, invalid_timestam
     """
     analysis_file = output_file.replace('.csv', '_analysis.xlsx')
     
-    with pd.ExcelWriter(analysis_file) as writer:
+    # xlsxwriter only writes workbooks and is faster than openpyxl. constant_memory mode is not
+    # used because pandas writes cells column by column, which that mode would silently drop.
+    with pd.ExcelWriter(analysis_file, engine='xlsxwriter') as writer:
         pd.DataFrame([{
             'Total Points': analysis['total_points'],
             'Duplicate Points': analysis['duplicate_points'],
@@ -443,13 +621,66 @@ def save_analysis(analysis, output_file, valid_timestamp_count, invalid_timestam
     print(f"Analysis saved as {analysis_file}")
 
 # Plot creation functions
-def create_plotly_map(df, plot_type):
+def _make_scatter(df, hover_data):
+    """Create a scatter plot on an OpenStreetMap base map."""
+    return _get_px().scatter_mapbox(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, zoom=3)
+
+def _make_heatmap(df, hover_data):
+    """Create a density heatmap, pre-binning large datasets into a grid."""
+    px = _get_px()
+    if len(df) > HEATMAP_BINNING_THRESHOLD:
+        # Aggregate large datasets into a grid so the figure holds one weighted point per occupied cell
+        counts, lat_edges, lon_edges = np.histogram2d(df['latitude'], df['longitude'], bins=HEATMAP_BINS)
+        lat_idx, lon_idx = np.nonzero(counts)
+        binned = pd.DataFrame({
+            'latitude': (lat_edges[lat_idx] + lat_edges[lat_idx + 1]) / 2,
+            'longitude': (lon_edges[lon_idx] + lon_edges[lon_idx + 1]) / 2,
+            'counts': counts[lat_idx, lon_idx]
+        })
+        return px.density_mapbox(binned, lat="latitude", lon="longitude", z="counts", radius=10, zoom=3)
+    return px.density_mapbox(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, zoom=3)
+
+def _make_lines(df, hover_data):
+    """Create a lines plot connecting the data points on a globe."""
+    return _get_px().line_geo(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, projection="orthographic")
+
+def _make_circles(df, hover_data):
+    """Create a circle marker plot on an OpenStreetMap base map."""
+    return _get_px().scatter_mapbox(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, zoom=3, size_max=15)
+
+def _make_polygon(df, hover_data):
+    """Create a polygon plot grouping the data points by name."""
+    return _get_px().line_geo(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, line_group="name", projection="orthographic")
+
+# Maps each plot type to the function that builds it
+_PLOT_DISPATCH = {
+    "Scatter Plot": _make_scatter,
+    "Heatmap": _make_heatmap,
+    "Lines Plot": _make_lines,
+    "Circle Markers": _make_circles,
+    "Polygon": _make_polygon,
+}
+
+def get_hover_data(df):
+    """
+    Build the hover data mapping shared by all plot types.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to plot.
+
+    Returns:
+        dict: The columns to show on hover.
+    """
+    return {col: True for col in df.columns if col not in ['name', 'longitude', 'latitude']}
+
+def create_plotly_map(df, plot_type, hover_data=None):
     """
     Create the appropriate plot based on the plot type selected using Plotly.
 
     Args:
         df (pd.DataFrame): The DataFrame to plot.
         plot_type (str): The type of plot to create.
+        hover_data (dict, optional): The columns to show on hover. Built from df if not given.
 
     Returns:
         plotly.graph_objects.Figure: The created plot.
@@ -457,27 +688,19 @@ def create_plotly_map(df, plot_type):
     Raises:
         ValueError: If an unknown plot type is specified.
     """
-    import plotly.express as px  # Lazy Load Plotly inside the function
-    
-    hover_data = {col: True for col in df.columns if col not in ['name', 'longitude', 'latitude']}
-    if plot_type == "Scatter Plot":
-        fig = px.scatter_mapbox(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, zoom=3)
-    elif plot_type == "Heatmap":
-        fig = px.density_mapbox(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, zoom=3)
-    elif plot_type == "Lines Plot":
-        fig = px.line_geo(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, projection="orthographic")
-    elif plot_type == "Circle Markers":
-        fig = px.scatter_mapbox(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, zoom=3, size_max=15)
-    elif plot_type == "Polygon":
-        fig = px.line_geo(df, lat="latitude", lon="longitude", hover_name="name", hover_data=hover_data, line_group="name", projection="orthographic")
-    else:
+    make_plot = _PLOT_DISPATCH.get(plot_type)
+    if make_plot is None:
         raise ValueError(f"Unknown plot type: {plot_type}")
 
+    if hover_data is None:
+        hover_data = get_hover_data(df)
+    fig = make_plot(df, hover_data)
+
     fig.update_layout(mapbox_style="open-street-map", height=1080, width=1920)
     logging.info(f"Map created: {plot_type}")
     return fig
 
-def export_plot(m, plot_name, prefix):
+def export_plot(m, plot_name, prefix, timestamp):
     """
     Export the plot to an HTML file.
 
@@ -485,29 +708,48 @@ def export_plot(m, plot_name, prefix):
         m (plotly.graph_objects.Figure): The plot to export.
         plot_name (str): The name of the plot.
         prefix (str): The prefix for the output file name.
+        timestamp (str): The run timestamp to include in the file name.
     """
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     html_file = f"{prefix}_{timestamp}_{plot_name}.html"
     m.write_html(html_file)
     logging.info(f"Plot saved as {html_file}")
     print(f"Plot saved as {html_file}")
 
-def export_all_plots(df, prefix):
+def render_plot(payload, plot_type, prefix, timestamp, hover_data):
+    """
+    Create and export a single plot in a worker process.
+
+    Args:
+        payload (bytes): The DataFrame to plot, serialized as Parquet.
+        plot_type (str): The type of plot to create.
+        prefix (str): The prefix for the output file name.
+        timestamp (str): The run timestamp to include in the file name.
+        hover_data (dict): The columns to show on hover.
+    """
+    df = convert_text_columns(pd.read_parquet(BytesIO(payload)))
+    m = create_plotly_map(df, plot_type, hover_data)
+    export_plot(m, plot_type.lower().replace(" ", "_"), prefix, timestamp)
+
+def export_all_plots(df, prefix, timestamp):
     """
     Export all plot types using parallel processing.
 
     Args:
         df (pd.DataFrame): The DataFrame to plot.
         prefix (str): The prefix for the output file names.
-    """
-    plot_types = ["Scatter Plot", "Heatmap", "Lines Plot", "Circle Markers", "Polygon"]
-    with ThreadPoolExecutor() as executor:
-        futures = {executor.submit(create_plotly_map, df, plot_type): plot_type.lower().replace(" ", "_") for plot_type in plot_types}
+        timestamp (str): The run timestamp to include in the file names.
+    """
+    plot_types = list(_PLOT_DISPATCH)
+    # Plot creation is CPU-bound and holds the GIL, so use processes instead of threads.
+    # The DataFrame is serialized once and shared by all workers.
+    payload = df.to_parquet(index=False)
+    hover_data = get_hover_data(df)
+    with ProcessPoolExecutor(max_workers=min(len(plot_types), os.cpu_count() or 1)) as executor:
+        futures = {executor.submit(render_plot, payload, plot_type, prefix, timestamp, hover_data): plot_type.lower().replace(" ", "_") for plot_type in plot_types}
         for future in tqdm(as_completed(futures), total=len(futures), desc="Exporting plots", unit=" plot"):
             plot_name = futures[future]
             try:
-                m = future.result()
-                export_plot(m, plot_name, prefix)
+                future.result()
             except ValueError as e:
                 logging.error(f"Error creating plot {plot_name}: {e}")
 
@@ -525,8 +767,24 @@ def display_countdown(seconds):
         time.sleep(1)
     print("\rReturning to main menu...                     ")
 
-def main():
-    """Main function to execute the script workflow."""
+def parse_arguments():
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Processes a KML file to generate an interactive map using Plotly.")
+    parser.add_argument('--csv', action='store_true', help="additionally export the parsed data as CSV files")
+    return parser.parse_args()
+
+def main(write_csv=False):
+    """
+    Main function to execute the script workflow.
+
+    Args:
+        write_csv (bool): Whether to export CSV files next to the Parquet files.
+    """
     while True:
         configure_logging()
         clear_screen()
@@ -534,9 +792,9 @@ def main():
 
         try:
             kml_file = get_kml_filename()
-            validate_kml_file(kml_file)
+            file_stat = validate_kml_file(kml_file)
             
-            df, valid_timestamp_count, invalid_timestamp_count = parse_kml(kml_file)
+            df, valid_timestamp_count, invalid_timestamp_count = load_kml_data(kml_file, file_stat)
             
             print_blank_line()
             prefix = input("Enter a prefix for the output files (optional): ")
@@ -545,9 +803,11 @@ def main():
             if not prefix:
                 prefix = "output"
 
-            output_file = get_output_filename(kml_file, prefix)
-            save_dataframe(df, output_file)
-            timestamped_output_file, timestamped_csv_file = save_dataframe_with_timestamps(df, output_file)
+            # One timestamp per run keeps all output files of a run grouped together
+            run_timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+            output_file = get_output_filename(kml_file, prefix, run_timestamp)
+            save_dataframe(df, output_file, write_csv)
+            timestamped_df = save_dataframe_with_timestamps(df, output_file, write_csv)
 
             # Perform and save analysis
             analysis = analyze_data(df)
@@ -555,29 +815,18 @@ def main():
             
             start_date, end_date = get_date_range(df)
             if start_date and end_date:
-                df = pd.read_feather(timestamped_output_file)
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-                df = filter_by_date(df, start_date, end_date)
-                filtered_output_file = output_file.replace('.csv', '_filtered.csv')
-                df.to_csv(filtered_output_file, index=False)
-                logging.info(f"Filtered data saved as {filtered_output_file}")
-                print(f"Filtered data saved as {filtered_output_file}")
+                # Only rows with valid timestamps can match, so filter the timestamped subset in memory
+                df = filter_by_date(timestamped_df, start_date, end_date)
+                save_dataframe(df, output_file.replace('.csv', '_filtered.csv'), write_csv)
 
             plot_types = choose_plot_types()
+            hover_data = get_hover_data(df)
             
             for plot_type in plot_types:
-                m = create_plotly_map(df, plot_type)
+                m = create_plotly_map(df, plot_type, hover_data)
                 plot_name = plot_type.lower().replace(" ", "_")
                 html_file = get_html_filename(f"{prefix}_{plot_name}.html")
-                export_plot(m, plot_name, prefix)
-                
-            # Delete the feather files if no longer needed
-            if os.path.exists(output_file.replace('.csv', '.feather')):
-                os.remove(output_file.replace('.csv', '.feather'))
-                logging.info(f"Feather file {output_file.replace('.csv', '.feather')} deleted")
-            if os.path.exists(timestamped_output_file):
-                os.remove(timestamped_output_file)
-                logging.info(f"Timestamped feather file {timestamped_output_file} deleted")
+                export_plot(m, plot_name, prefix, run_timestamp)
 
             # Visualize a 3-second countdown before clearing the screen
             display_countdown(3)
@@ -588,4 +837,6 @@ def main():
             print(e)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    multiprocessing.freeze_support()
+    args = parse_arguments()
+    main(write_csv=args.csv)
\ No newline at end of file
@@ -0,0 +1,105 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plotly.io as pio
+
+import UFEDMapper
+
+KML_WITH_MISSING_VALUES = """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2"><Document>
+<Placemark><name>A</name><description>first</description>
+<ExtendedData><Data name="Source"><value>s1</value></Data></ExtendedData>
+<Point><coordinates>13.1,52.1,0</coordinates></Point></Placemark>
+<Placemark><name>B</name><description>second</description>
+<TimeStamp><when>2023-01-01T10:00:00Z</when></TimeStamp>
+<ExtendedData><Data name="Source"><value>s2</value></Data></ExtendedData>
+<Point><coordinates>13.2,52.2,0</coordinates></Point></Placemark>
+<Placemark><name>C</name>
+<Point><coordinates>13.3,52.3,0</coordinates></Point></Placemark>
+</Document></kml>
+"""
+
+JSON_ENGINES = ["json"]
+try:
+    import orjson  # noqa: F401
+    JSON_ENGINES.append("orjson")
+except ImportError:
+    pass
+
+
+@pytest.mark.parametrize("json_engine", JSON_ENGINES)
+@pytest.mark.parametrize("plot_type", list(UFEDMapper._PLOT_DISPATCH))
+def test_export_plot_with_missing_values(tmp_path, monkeypatch, json_engine, plot_type):
+    kml_file = tmp_path / "Missing.kml"
+    kml_file.write_text(KML_WITH_MISSING_VALUES, encoding="utf-8")
+    df, _, _ = UFEDMapper.parse_kml(str(kml_file))
+    assert df['description'].isna().any()
+    assert df['Source'].isna().any()
+
+    monkeypatch.setattr(pio.json.config, "default_engine", json_engine)
+    monkeypatch.chdir(tmp_path)
+    m = UFEDMapper.create_plotly_map(df, plot_type)
+    UFEDMapper.export_plot(m, plot_type.lower().replace(" ", "_"), "test", "20240101000000")
+
+    assert (tmp_path / f"test_20240101000000_{plot_type.lower().replace(' ', '_')}.html").is_file()
+
+
+@pytest.mark.parametrize("json_engine", JSON_ENGINES)
+@pytest.mark.parametrize("plot_type", list(UFEDMapper._PLOT_DISPATCH))
+def test_export_plot_from_cache_with_missing_values(tmp_path, monkeypatch, json_engine, plot_type):
+    kml_file = tmp_path / "Missing.kml"
+    kml_file.write_text(KML_WITH_MISSING_VALUES, encoding="utf-8")
+    monkeypatch.setattr(UFEDMapper, "CACHE_DIR", str(tmp_path / "cache"))
+    file_stat = UFEDMapper.validate_kml_file(str(kml_file))
+    parsed_df, _, _ = UFEDMapper.load_kml_data(str(kml_file), file_stat)
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+    df, valid_timestamp_count, invalid_timestamp_count = UFEDMapper.load_kml_data(str(kml_file), file_stat)
+    assert (valid_timestamp_count, invalid_timestamp_count) == (1, 2)
+    assert df.dtypes.equals(parsed_df.dtypes)
+
+    monkeypatch.setattr(pio.json.config, "default_engine", json_engine)
+    monkeypatch.chdir(tmp_path)
+    m = UFEDMapper.create_plotly_map(df, plot_type)
+    UFEDMapper.export_plot(m, plot_type.lower().replace(" ", "_"), "test", "20240101000000")
+
+    assert (tmp_path / f"test_20240101000000_{plot_type.lower().replace(' ', '_')}.html").is_file()
+
+
+def test_load_kml_data_prunes_stale_cache_files(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    stale_version = cache_dir / f"Other_0123456789ab_10_0_v{UFEDMapper.CACHE_VERSION - 1}.parquet"
+    other_file = cache_dir / f"Other_0123456789ab_10_0_v{UFEDMapper.CACHE_VERSION}.parquet"
+    stale_version.write_bytes(b"")
+    other_file.write_bytes(b"")
+    monkeypatch.setattr(UFEDMapper, "CACHE_DIR", str(cache_dir))
+
+    kml_file = tmp_path / "Missing.kml"
+    kml_file.write_text(KML_WITH_MISSING_VALUES, encoding="utf-8")
+    UFEDMapper.load_kml_data(str(kml_file), UFEDMapper.validate_kml_file(str(kml_file)))
+    kml_file.write_text(KML_WITH_MISSING_VALUES + "\n", encoding="utf-8")
+    UFEDMapper.load_kml_data(str(kml_file), UFEDMapper.validate_kml_file(str(kml_file)))
+
+    remaining = sorted(os.listdir(cache_dir))
+    assert not stale_version.exists()
+    assert other_file.name in remaining
+    assert len(remaining) == 2
+
+
+@pytest.mark.parametrize("json_engine", JSON_ENGINES)
+def test_export_all_plots_with_missing_values(tmp_path, monkeypatch, json_engine):
+    kml_file = tmp_path / "Missing.kml"
+    kml_file.write_text(KML_WITH_MISSING_VALUES, encoding="utf-8")
+    df, _, _ = UFEDMapper.parse_kml(str(kml_file))
+
+    monkeypatch.setattr(pio.json.config, "default_engine", json_engine)
+    monkeypatch.chdir(tmp_path)
+    UFEDMapper.export_all_plots(df, "test", "20240101000000")
+
+    for plot_type in UFEDMapper._PLOT_DISPATCH:
+        assert (tmp_path / f"test_20240101000000_{plot_type.lower().replace(' ', '_')}.html").is_file()